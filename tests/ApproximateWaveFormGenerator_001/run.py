@@ -0,0 +1,41 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+import math
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/simulation-blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying the same wave form, computed directly and from a sample table.
+		params = {'type':'sawtooth', 'frequency':0.1, 'amplitude':2.0, 'harmonicCount':5}
+		self.directId = self.createTestModel('apamax.analyticsbuilder.blocks.simulation.ApproximateWaveFormGenerator', params)
+		self.tableId = self.createTestModel('apamax.analyticsbuilder.blocks.simulation.ApproximateWaveFormGenerator', dict(params, tableSize=4096))
+		
+		events = []
+		for t in range(1, 8):
+			events += [self.timestamp(t),
+			           self.inputEvent('trigger', True, id = self.directId),
+			           self.inputEvent('trigger', True, id = self.tableId)]
+		events.append(self.timestamp(10))
+		self.sendEventStrings(correlator, *events)
+
+	def expected(self, t):
+		return 1.0 - (2.0 / math.pi) * sum(math.sin(2.0 * math.pi * 0.1 * k * t) / k for k in range(1, 6))
+
+	def validate(self):
+		# Verifying that the models are deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.directId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.tableId + '\" with PRODUCTION mode has started')
+		for modelId, tolerance in [(self.directId, 1e-9), (self.tableId, 1e-4)]:
+			outputs = self.getExprFromFile('output.evt', '"output","' + modelId + '","",([0-9.]+),any[(]float,(.*)[)],', returnAll=True, returnNoneIfMissing=True)
+			self.assertThat('len(outputs) == 7', outputs=outputs)
+			for time, value in outputs:
+				self.assertThat('abs(value - expected) < tolerance', value=float(value), expected=self.expected(float(time)), tolerance=tolerance)
@@ -0,0 +1,52 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+OUTPUT_REGEX = r'Output\("value","%(modelId)s","[^"]*",[^,]*,any\(boolean,true\),\{%(properties)s\}\)'
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model which combines signals received within the delay.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.ReceiveAsyncSignal',{'signalType':'Reset', 'scopeToModel': False, 'delay': 0.5, 'coalesce': True})
+		# A model which receives the same signals without combining them.
+		self.separateId = self.createTestModel('apamax.analyticsbuilder.blocks.ReceiveAsyncSignal',{'signalType':'Reset', 'scopeToModel': False, 'delay': 0.5})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+							  'apamax.analyticsbuilder.blocks.AsyncSignal("Reset","",any(),{"a":any(float,100),"b":any(float,1)})',
+							  'apamax.analyticsbuilder.blocks.AsyncSignal("Reset","",any(),{"a":any(float,200)})',
+							  self.timestamp(2),
+							  'apamax.analyticsbuilder.blocks.AsyncSignal("Reset","",any(),{"c":any(float,3)})',
+							  self.timestamp(3),
+							  channel='apamax.analyticsbuilder.blocks.AsyncSignal')
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# the first two signals are combined into one output
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.separateId + '\" with PRODUCTION mode has started')
+		# the first two signals are combined into one output
+		self.assertLineCount('output.evt', expr='Output\("value","' + self.modelId + '"', condition='==2')
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.modelId, 'properties':'"a":any\\(float,200\\),"b":any\\(float,1\\)'})
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.modelId, 'properties':'"c":any\\(float,3\\)'})
+		# combining does not change the signals received by the other model
+		self.assertLineCount('output.evt', expr='Output\("value","' + self.separateId + '"', condition='==3')
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.separateId, 'properties':'"a":any\\(float,100\\),"b":any\\(float,1\\)'})
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.separateId, 'properties':'"a":any\\(float,200\\)'})
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.separateId, 'properties':'"c":any\\(float,3\\)'})
+
+		
\ No newline at end of file
@@ -0,0 +1,35 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model in streaming mode with at most 2 rows per output.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile','rowsPerOutput':2})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('csv', 'field1,field2\n11,12\n21,', id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('csv', '22\n31,32\n41,42\n', id = self.modelId),
+		                      self.timestamp(3)
+							  )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# the partial line "21," is only output once the rest of it has been received
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,11\),"field2":any\(float,12\)}\]}')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,21\),"field2":any\(float,22\)},{"field1":any\(float,31\),"field2":any\(float,32\)}\]}')
+		# the remaining row is output in a later activation
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,41\),"field2":any\(float,42\)}\]}')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,21\),"field2":any\(float,22\)},{"field1":any\(float,31\),"field2":any\(float,32\)},', contains=False)
@@ -0,0 +1,46 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a model with declared column types and one with types inferred from the first 2 rows.
+		self.declaredId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile','columnTypes':'string, float, boolean'})
+		self.inferredId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile','inferenceRows':2})
+		self.strictId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile','columnTypes':'integer, float'})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('csv', 'name,temp,ok\nA,1.5,true\nB,n/a,false', id = self.declaredId),
+		                      self.timestamp(2),
+		                      self.inputEvent('csv', 'id,temp\n0,2.5\n7,3\nX,4', id = self.inferredId),
+		                      self.timestamp(3),
+		                      self.inputEvent('csv', 'n,x\n1.5,12abc\n-2,3e2', id = self.strictId),
+		                      self.timestamp(4)
+							  )
+
+	def validate(self):
+		# Verifying that the models are deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.declaredId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.inferredId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.strictId + '\" with PRODUCTION mode has started')
+		# the cell which is not a float is kept as a string
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"name":any\(string,"A"\),"ok":any\(boolean,true\),"temp":any\(float,1.5\)},{"name":any\(string,"B"\),"ok":any\(boolean,false\),"temp":any\(string,"n/a"\)}\]}')
+		# the id column is inferred as integer from "0" and "7", and temp as float from "2.5" and "3", so "X" does not match
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"id":any\(integer,0\),"temp":any\(float,2.5\)},{"id":any\(float,7\),"temp":any\(float,3\)},{"id":any\(string,"X"\),"temp":any\(float,4\)}\]}')
+		# only the whole cell is converted, so a number followed by other characters does not match
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"n":any\(string,"1.5"\),"x":any\(string,"12abc"\)},{"n":any\(integer,-2\),"x":any\(float,300\)}\]}')
+		# both mismatches are reported
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='"cell":any\(string,"n/a"\),"column":any\(string,"temp"\),"expectedType":any\(string,"float"\),"row":any\(integer,2\)')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='"cell":any\(string,"X"\),"column":any\(string,"id"\),"expectedType":any\(string,"integer"\),"row":any\(integer,3\)')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='"cell":any\(string,"1.5"\),"column":any\(string,"n"\),"expectedType":any\(string,"integer"\),"row":any\(integer,1\)')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='"cell":any\(string,"12abc"\),"column":any\(string,"x"\),"expectedType":any\(string,"float"\),"row":any\(integer,1\)')
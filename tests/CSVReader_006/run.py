@@ -0,0 +1,35 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model in streaming mode which ends the stream after 2 seconds without input.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile','rowsPerOutput':10,'endOfStreamTimeout':2.0})
+		
+		# The last line has no line delimiter. It is parsed 2 seconds after the last input, at 4 seconds.
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('csv', 'field1,field2\n11,12\n21,', id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('csv', '22', id = self.modelId),
+		                      self.timestamp(3),
+		                      self.timestamp(5)
+							  )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,11\),"field2":any\(float,12\)}\]}')
+		# the last line is output once, on its own
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,21\),"field2":any\(float,22\)}\]}', condition='==1')
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = ', condition='==2')
@@ -0,0 +1,33 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model in streaming mode with one row per output and at most 2 rows waiting.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile','rowsPerOutput':1,'maxPendingRows':2})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('csv', 'field1\n1\n2\n3\n4\n', id = self.modelId),
+		                      self.timestamp(2)
+							  )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# the first row is output at once, leaving 3 rows waiting, so the oldest of them is dropped
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Dropping 1 CSV rows as more than 2 are waiting to be output')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,1\)}\]}')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,2\)}\]}', contains=False)
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,3\)}\]}')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='jsonOutput = {"infile":\[{"field1":any\(float,4\)}\]}')
@@ -0,0 +1,36 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a model in document mode and one in streaming mode.
+		self.documentId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile'})
+		self.streamId = self.createTestModel('apamax.analyticsbuilder.custom.CSVReader',{'fragmentName':'infile','rowsPerOutput':10})
+		
+		# The same CSV with an empty line, ending with a line delimiter in streaming mode so the last line is complete.
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('csv', 'field1,field2\n11,12\n\n31,32', id = self.documentId),
+		                      self.inputEvent('csv', 'field1,field2\n11,12\n\n31,32\n', id = self.streamId),
+		                      self.timestamp(2)
+							  )
+
+	def output(self, modelId):
+		return self.getExprFromFile('output.evt', '"jsonOutput","' + modelId + '",.*any\(string,(".*")\)')
+
+	def validate(self):
+		# Verifying that the models are deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.documentId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.streamId + '\" with PRODUCTION mode has started')
+		# the empty line is a row between the other two in both modes
+		self.assertThat('document == stream', document=self.output(self.documentId), stream=self.output(self.streamId))
@@ -0,0 +1,29 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model with correct parameter.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.CSVWriter')
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', '{"infile": [{"field1": 11,"field2": "a","field3": true},{"field2": "b","field3": false,"field4": 24},{"field3": true,"field1": 31.5,"field2": "c"}]}', id = self.modelId),
+		                      self.timestamp(2)
+							  )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# keys missing from a row are empty cells, and keys not in the first row are not written
+		self.assertGrep('output.evt', expr=self.outputExpr('csvOutput','field1,field2,field3[\]n11,a,true[\]n,b,false[\]n31.5,c,true'))
+		
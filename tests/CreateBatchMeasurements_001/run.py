@@ -0,0 +1,65 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+import json
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def inputManagedObject(self, id, type, name, params={}):
+		"""
+		Generate the string form of a managed object event.
+		:param id: Unique device identifier of the device.
+		:param type: Type of the device.
+		:param name: Name of the device.
+		:param params: Other fragments for the managed object.
+		"""
+		managedObjectParams = ', '.join([json.dumps(id), json.dumps(type), json.dumps(name)] + [json.dumps([])] * 6 +
+								[json.dumps(json.dumps({})), json.dumps(json.dumps(params))])
+		return f'apamax.analyticsbuilder.test.SendManagedObject({managedObjectParams})'
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/cumulocity-blocks/')
+
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/CreateMultiMeasurement_001/Input/SendC8yObjects.mon')
+		correlator.injectEPL(self.input + '/LogC8yRequests.mon')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model which sends batches of 3 points, or any points held for 10 seconds.
+		self.modelId = self.createTestModel('apamax.analyticskit.blocks.cumulocity.CreateBatchMeasurements',
+									  {'deviceId':'d123', 'fragment':'c8y_Temperature', 'series':'T', 'unit':'C', 'maxBatchSize':3, 'flushInterval':10.0})
+
+		self.sendEventStrings(correlator,
+							self.inputManagedObject('d123', '', '', {'c8y_IsDevice':{}}))
+
+		# The third point fills the first batch. Without coalesce, the two points for the same time are both held, and sent when the flush interval has elapsed.
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{1.0:10.0, 1.5:11.0}}),
+		                      self.timestamp(2),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{2.0:12.0}}),
+		                      self.timestamp(3),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{3.0:13.0}}),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{3.0:14.0}}),
+		                      self.timestamp(14),
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# One request per batch, and no single measurements.
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='Received GenericRequest: POST /measurement/measurements', condition='==2')
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='Received Measurement:', condition='==0')
+		# Each measurement in a collection is tagged with the model, as the framework does for a Measurement.
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='with 3 measurements: (.*"apama_analytics_modelName":"' + self.modelId + '"){3}', condition='==1')
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='with 2 measurements: (.*"apama_analytics_modelName":"' + self.modelId + '"){2}', condition='==1')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='with 3 measurements: .*"time":"1970-01-01T00:00:01.000Z".*"time":"1970-01-01T00:00:01.500Z".*"time":"1970-01-01T00:00:02.000Z"')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='with 2 measurements: .*"value":13(\.0)?[,}].*"time":"1970-01-01T00:00:03.000Z".*"value":14(\.0)?[,}].*"time":"1970-01-01T00:00:03.000Z"')
@@ -0,0 +1,64 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+import json
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def inputManagedObject(self, id, type, name, params={}):
+		"""
+		Generate the string form of a managed object event.
+		:param id: Unique device identifier of the device.
+		:param type: Type of the device.
+		:param name: Name of the device.
+		:param params: Other fragments for the managed object.
+		"""
+		managedObjectParams = ', '.join([json.dumps(id), json.dumps(type), json.dumps(name)] + [json.dumps([])] * 6 +
+								[json.dumps(json.dumps({})), json.dumps(json.dumps(params))])
+		return f'apamax.analyticsbuilder.test.SendManagedObject({managedObjectParams})'
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/cumulocity-blocks/')
+
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/CreateMultiMeasurement_001/Input/SendC8yObjects.mon')
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/CreateBatchMeasurements_001/Input/LogC8yRequests.mon')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model which coalesces points for the same time, and sends any points held for 10 seconds.
+		self.modelId = self.createTestModel('apamax.analyticskit.blocks.cumulocity.CreateBatchMeasurements',
+									  {'deviceId':'d123', 'fragment':'c8y_Temperature', 'series':'T', 'unit':'C', 'maxBatchSize':3, 'flushInterval':10.0, 'coalesce':True})
+
+		self.sendEventStrings(correlator,
+							self.inputManagedObject('d123', '', '', {'c8y_IsDevice':{}}))
+
+		# The points for 1.0 and 3.0 are replaced, so the batch is not full until the point for 4.0. The later point for 3.0 is in the next batch.
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{1.0:10.0, 3.0:11.0}}),
+		                      self.timestamp(2),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{1.0:12.0}}),
+		                      self.timestamp(3),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{3.0:13.0}}),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{4.0:14.0}}),
+		                      self.inputEvent('send', True, id = self.modelId, properties={'measurements':{3.0:15.0}}),
+		                      self.timestamp(14),
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='Received GenericRequest: POST /measurement/measurements', condition='==2')
+		# The last value for each time, in the order the times were first received.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='with 3 measurements: .*"value":12(\.0)?[,}].*"time":"1970-01-01T00:00:01.000Z".*"value":13(\.0)?[,}].*"time":"1970-01-01T00:00:03.000Z".*"value":14(\.0)?[,}].*"time":"1970-01-01T00:00:04.000Z"')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='with 1 measurements: .*"value":15(\.0)?[,}].*"time":"1970-01-01T00:00:03.000Z"')
+		for value in [10, 11]:
+			self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr=f'"value":{value}(\\.0)?[,}}]', contains=False)
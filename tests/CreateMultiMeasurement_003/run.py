@@ -0,0 +1,83 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+import json, time
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def inputManagedObject(self, id, type, name, supportedOperations=[], supportedMeasurements=[], childDeviceIds=[], childAssetIds=[],deviceParentIds=[], assetParentIds=[], position={}, params={}):
+		"""
+		Generate the string form of a managed object event.
+		:param id: Unique device identifier of the device.
+		:param name: Name of the device.
+		:param supportedOperations: A list of supported operations for this device.
+		:param supportedMeasurements: A list of supported measurements for this device.
+		:param childDeviceIds: The identifiers of the child devices.
+		:param childAssetIds: The identifiers of the child assets.
+		:param deviceParentIds: The identifiers of the parent devices.
+		:param assetParentIds: The identifiers of the parent assets.
+		:param position: Contains 'lat', 'lng', 'altitude' and 'accuracy'.
+		:param params: Other fragments for the managed object.
+		"""
+		managedObjectParams = ', '.join([json.dumps(id), json.dumps(type), json.dumps(name), json.dumps(supportedOperations), json.dumps(supportedMeasurements),
+								json.dumps(childDeviceIds), json.dumps(childAssetIds), json.dumps(deviceParentIds),
+								json.dumps(assetParentIds),
+								json.dumps(json.dumps(position)),
+								json.dumps(json.dumps(params))])
+		return f'apamax.analyticsbuilder.test.SendManagedObject({managedObjectParams})'
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/cumulocity-blocks/')
+		
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/CreateMultiMeasurement_001/Input/SendC8yObjects.mon')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model with correct parameter.
+		self.modelId = self.createTestModel('apamax.analyticskit.blocks.cumulocity.CreateMultiMeasurement',
+									  {'deviceId':'d123', 'measurementType': 'c8y_Acceleration'},
+									  inputs={'time': None})
+		
+		self.sendEventStrings(correlator,
+							self.inputManagedObject('d123', '' ,'',[],[],[],[],[],[],{},{'c8y_IsDevice':{}}))
+
+		# Many inputs using the same small set of keys, so the keys are only split once.
+		self.count = 2000
+		events = []
+		for i in range(1, self.count + 1):
+			events.append(self.timestamp(i))
+			events.append(self.inputEvent('value', True, id = self.modelId,
+										properties={'c8y_Acceleration.x':float(i),'c8y_Acceleration.y':{'value':0.5,'unit':'m/s2'},'c8y_Speed.v':2.0,'other':'ignored'}))
+		events.append(self.timestamp(self.count + 1))
+
+		start = time.time()
+		self.sendEventStrings(correlator, *events)
+		self.waitForGrep('waiter.out', expr='com.apama.cumulocity.Measurement\(', condition=f'>={self.count}', timeout=TIMEOUTS['WaitForProcess'])
+		self.log.info('Created %d measurements in %.2f seconds', self.count, time.time() - start)
+
+		# More keys than are cached, so the cache is cleared, then the earlier keys again, and keys without exactly one dot.
+		self.sendEventStrings(correlator,
+							self.inputEvent('value', True, id = self.modelId, properties={f'c8y_Many.s{i}':float(i) for i in range(1001)}),
+							self.timestamp(self.count + 2),
+							self.inputEvent('value', True, id = self.modelId,
+										properties={'c8y_Acceleration.x':-1.0,'c8y_Speed.v':{'value':'fast','unit':3},'c8y_Extra.a.b':1.0,'nodot':2.0}),
+							self.timestamp(self.count + 3))
+		self.waitForGrep('waiter.out', expr='com.apama.cumulocity.Measurement\(', condition=f'>={self.count + 2}', timeout=TIMEOUTS['WaitForProcess'])
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertLineCount("waiter.out", expr='com.apama.cumulocity.Measurement\(', condition=f'=={self.count + 2}')
+		self.assertGrep("waiter.out", expr='com.apama.cumulocity.Measurement\("","c8y_Acceleration","d123",2000,{"c8y_Acceleration":{"x":com.apama.cumulocity.MeasurementValue\(2000,"",{}\),"y":com.apama.cumulocity.MeasurementValue\(0.5,"m/s2",{}\)},"c8y_Speed":{"v":com.apama.cumulocity.MeasurementValue\(2,"",{}\)}},{"apama_analytics_modelName":any\(string,"' + self.modelId + '"\)}\)')
+		self.assertGrep("waiter.out", expr='com.apama.cumulocity.Measurement\("","c8y_Acceleration","d123",2001,{"c8y_Many":{"s0":com.apama.cumulocity.MeasurementValue\(0,"",{}\),.*"s999":com.apama.cumulocity.MeasurementValue\(999,"",{}\)}}')
+		# The keys split before the cache was cleared are still used, and a value and unit of the wrong types are not set.
+		self.assertGrep("waiter.out", expr='com.apama.cumulocity.Measurement\("","c8y_Acceleration","d123",2002,{"c8y_Acceleration":{"x":com.apama.cumulocity.MeasurementValue\(-1,"",{}\)},"c8y_Speed":{"v":com.apama.cumulocity.MeasurementValue\(0,"",{}\)}},')
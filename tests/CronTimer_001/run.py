@@ -0,0 +1,33 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model which ticks every 10 seconds.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.CronTimer', {'seconds':'*/10'})
+		
+		# the ticks follow the model time, not the wall clock
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.timestamp(15),
+		                      self.timestamp(25),
+		                      self.timestamp(35)
+							  )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('tick', True, time=10))
+		self.assertGrep('output.evt', expr=self.outputExpr('tick', True, time=20))
+		self.assertGrep('output.evt', expr=self.outputExpr('tick', True, time=30))
+		self.assertLineCount('output.evt', expr=self.outputExpr('tick', True), condition='==3')
@@ -0,0 +1,35 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a model which ticks at midnight on the 29th of February when it is a Monday, first in 1988.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.CronTimer',
+									{'seconds':'0', 'minutes':'0', 'hours':'0', 'daysOfMonth':'29', 'months':'2', 'daysOfWeek':'1'})
+		# and one which can never tick.
+		self.neverId = self.createTestModel('apamax.analyticsbuilder.blocks.CronTimer', {'daysOfMonth':'30', 'months':'2'})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.timestamp(573091201)
+							  )
+
+	def validate(self):
+		logfile = self.analyticsBuilderCorrelator.logfile
+		self.assertGrep(logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# 1988-02-29T00:00:00Z, more than 18 years after the model started
+		self.assertGrep('output.evt', expr=self.outputExpr('tick', True, self.modelId, time=573091200))
+		self.assertLineCount('output.evt', expr=self.outputExpr('tick', True), condition='==1')
+		# The schedule which never matches is rejected when the model is validated.
+		self.assertGrep(logfile, expr='Model \"' + self.neverId + '\" with PRODUCTION mode has started', contains=False)
+		self.assertGrep(logfile, expr='No time matches the seconds, minutes, hours, daysOfMonth, months and daysOfWeek')
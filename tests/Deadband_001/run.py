@@ -0,0 +1,19 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		pass
+
+	def validate(self):
+		# The blocks and cumulocity-blocks directories are built into separate extensions, so each has a copy of Deadband.
+		copies = {}
+		for directory in ['blocks', 'cumulocity-blocks']:
+			with open(f'{self.project.SOURCE}/{directory}/Deadband.mon') as f:
+				copies[directory] = [line for line in f.read().splitlines() if not line.startswith('package ')]
+		self.assertThat('blocksCopy == cumulocityCopy', blocksCopy=copies['blocks'], cumulocityCopy=copies['cumulocity-blocks'])
@@ -0,0 +1,68 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+import json
+
+OUTPUT_REGEX = r'Output\("measurementValue","%(modelId)s","[^"]*",[^,]*,any\(float,%(value)s\),\{.*"source":any\(string,"%(source)s"\)'
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def inputMeasurement(self, source, time, fragment, series, value, unit='', id='', type='', params={}, valueParams={}):
+		"""
+		Generate the string form of a request to send a measurement with a single value.
+		:param source: The device the measurement is from.
+		:param time: The measurement time.
+		:param fragment: The measurement fragment.
+		:param series: The series within the fragment.
+		:param value: The value of the series.
+		:param unit: The unit of the value.
+		:param id: The measurement identifier.
+		:param type: The measurement type.
+		:param params: Other fragments for the measurement.
+		:param valueParams: Other parameters of the value.
+		"""
+		measurementParams = ', '.join([json.dumps(id), json.dumps(type), json.dumps(source), json.dumps(time), json.dumps(fragment),
+								json.dumps(series), json.dumps(value), json.dumps(unit),
+								json.dumps(json.dumps(params)), json.dumps(json.dumps(valueParams))])
+		return f'apamax.analyticsbuilder.test.SendMeasurement({measurementParams})'
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/cumulocity-blocks/')
+
+		# The mock inventory treats 'group1' as a group with the devices '1' and '2'.
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/CreateMultiMeasurement_001/Input/SendC8yObjects.mon')
+		correlator.injectEPL(self.input + '/SendMeasurements.mon')
+
+		# One listener on the fragment and series, filtering on the devices of the group.
+		self.modelId = self.createTestModel('apamax.analyticskit.blocks.cumulocity.DeviceMeasurementInput',
+									  {'deviceId':'group1', 'fragmentSeries':'c8y_Temperature.T', 'ignoreTimestamp':True, 'properties':'core'})
+
+		self.sendEventStrings(correlator,
+							self.timestamp(1),
+							self.inputMeasurement('1', 1.1, 'c8y_Temperature', 'T', 21.5),
+							self.inputMeasurement('2', 1.2, 'c8y_Temperature', 'T', 22.5),
+							# Not a device of the group.
+							self.inputMeasurement('3', 1.3, 'c8y_Temperature', 'T', 30.0),
+							# A device of the group, but another series or fragment.
+							self.inputMeasurement('1', 1.4, 'c8y_Temperature', 'U', 40.0),
+							self.inputMeasurement('2', 1.5, 'c8y_Humidity', 'T', 50.0),
+							self.inputMeasurement('2', 1.6, 'c8y_Temperature', 'T', 23.5),
+							self.timestamp(2)
+							)
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.modelId, 'value':21.5, 'source':'1'})
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.modelId, 'value':22.5, 'source':'2'})
+		self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'modelId':self.modelId, 'value':23.5, 'source':'2'})
+		self.assertLineCount('output.evt', expr='Output\("measurementValue","' + self.modelId + '"', condition='==3')
+		self.assertGrep('output.evt', expr='"source":any\(string,"3"\)', contains=False)
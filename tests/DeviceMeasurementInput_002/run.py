@@ -0,0 +1,92 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+import json
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def inputMeasurement(self, source, time, fragment, series, value, unit='', id='', type='', params={}, valueParams={}):
+		"""
+		Generate the string form of a request to send a measurement with a single value.
+		:param source: The device the measurement is from.
+		:param time: The measurement time.
+		:param fragment: The measurement fragment.
+		:param series: The series within the fragment.
+		:param value: The value of the series.
+		:param unit: The unit of the value.
+		:param id: The measurement identifier.
+		:param type: The measurement type.
+		:param params: Other fragments for the measurement.
+		:param valueParams: Other parameters of the value.
+		"""
+		measurementParams = ', '.join([json.dumps(id), json.dumps(type), json.dumps(source), json.dumps(time), json.dumps(fragment),
+								json.dumps(series), json.dumps(value), json.dumps(unit),
+								json.dumps(json.dumps(params)), json.dumps(json.dumps(valueParams))])
+		return f'apamax.analyticsbuilder.test.SendMeasurement({measurementParams})'
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/cumulocity-blocks/')
+
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/CreateMultiMeasurement_001/Input/SendC8yObjects.mon')
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/DeviceMeasurementInput_001/Input/SendMeasurements.mon')
+
+		self.modelIds = {}
+		for properties in ['none', 'core', 'all']:
+			self.modelIds[properties] = self.createTestModel('apamax.analyticskit.blocks.cumulocity.DeviceMeasurementInput',
+									  {'deviceId':'d1', 'fragmentSeries':'c8y_Temperature.T', 'ignoreTimestamp':True, 'properties':properties})
+
+		# More keys than the block caches, so the cache of prefixed keys is cleared part way through.
+		manyParams = {f'p{i}':i for i in range(1001)}
+
+		self.sendEventStrings(correlator,
+							self.timestamp(1),
+							self.inputMeasurement('d1', 1.1, 'c8y_Temperature', 'T', 21.5, unit='C', id='m1', type='c8y_TemperatureMeasurement',
+												params={'note':'hot'}, valueParams={'quality':'good'}),
+							self.timestamp(2),
+							self.inputMeasurement('d1', 2.1, 'c8y_Temperature', 'T', 22.5, unit='C', id='m2', type='c8y_TemperatureMeasurement',
+												params=manyParams),
+							self.timestamp(3),
+							# Keys cached before the cache was cleared, and a new one.
+							self.inputMeasurement('d1', 3.1, 'c8y_Temperature', 'T', 23.5, unit='C', id='m3', type='c8y_TemperatureMeasurement',
+												params={'p0':'first', 'note':'cold'}, valueParams={'quality':'bad'}),
+							self.timestamp(4)
+							)
+
+	def propertiesExpr(self, properties, value, expr):
+		"""Regular expression for the output of the model with the given properties mode, followed by expr."""
+		return r'Output\("measurementValue","' + self.modelIds[properties] + r'","[^"]*",[^,]*,any\(float,' + str(value) + r'\),' + expr
+
+	def validate(self):
+		# Verifying that the models are deployed successfully.
+		for properties, modelId in self.modelIds.items():
+			self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + modelId + '\" with PRODUCTION mode has started')
+			self.assertLineCount('output.evt', expr='Output\("measurementValue","' + modelId + '"', condition='==3')
+
+		# No properties.
+		for value in [21.5, 22.5, 23.5]:
+			self.assertGrep('output.evt', expr=self.propertiesExpr('none', value, r'\{\}\)'))
+
+		# The core properties, in both the core and all modes.
+		for properties in ['core', 'all']:
+			for key, val in [('fragment', 'any\\(string,"c8y_Temperature"\\)'), ('id', 'any\\(string,"m1"\\)'), ('series', 'any\\(string,"T"\\)'),
+							('source', 'any\\(string,"d1"\\)'), ('time', 'any\\(float,1.1\\)'), ('type', 'any\\(string,"c8y_TemperatureMeasurement"\\)'),
+							('unit', 'any\\(string,"C"\\)'), ('value', 'any\\(float,21.5\\)')]:
+				self.assertGrep('output.evt', expr=self.propertiesExpr(properties, 21.5, r'\{.*"' + key + '":' + val))
+		self.assertGrep('output.evt', expr=self.propertiesExpr('core', 21.5, r'\{.*"measurement_'), contains=False)
+		self.assertGrep('output.evt', expr=self.propertiesExpr('core', 21.5, r'\{.*"value_'), contains=False)
+
+		# All properties, with the measurement and value parameters prefixed.
+		self.assertGrep('output.evt', expr=self.propertiesExpr('all', 21.5, r'\{.*"measurement_note":any\(string,"hot"\)'))
+		self.assertGrep('output.evt', expr=self.propertiesExpr('all', 21.5, r'\{.*"value_quality":any\(string,"good"\)'))
+		self.assertGrep('output.evt', expr=self.propertiesExpr('all', 22.5, r'\{.*"measurement_p0":any\(integer,0\)'))
+		self.assertGrep('output.evt', expr=self.propertiesExpr('all', 22.5, r'\{.*"measurement_p1000":any\(integer,1000\)'))
+		self.assertGrep('output.evt', expr=self.propertiesExpr('all', 23.5, r'\{.*"measurement_note":any\(string,"cold"\)'))
+		self.assertGrep('output.evt', expr=self.propertiesExpr('all', 23.5, r'\{.*"measurement_p0":any\(string,"first"\)'))
+		self.assertGrep('output.evt', expr=self.propertiesExpr('all', 23.5, r'\{.*"value_quality":any\(string,"bad"\)'))
@@ -40,7 +40,7 @@ class PySysTest(AnalyticsBuilderBaseTest):
         self.assertGrep('output.evt', expr=self.outputExpr('min', 100, time=3))
         self.assertGrep('output.evt', expr=self.outputExpr('max', time=3))
         self.assertGrep('output.evt', expr=self.outputExpr('mean', 110, time=3))
-        self.assertGrep('output.evt', expr=self.outputExpr('standardDeviation', 8.164965809277223, time=3))
+        self.assertGrep('output.evt', expr=self.outputExpr('standardDeviation', 8.16496580927726, time=3))
         self.assertGrep('output.evt', expr=self.outputExpr('sum', 30, time=4))
         self.assertGrep('output.evt', expr=self.outputExpr('count', 1, time=4))
         self.assertGrep('output.evt', expr=self.outputExpr('mean', 30, time=4))
@@ -0,0 +1,45 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+
+class PySysTest(AnalyticsBuilderBaseTest):
+    def execute(self):
+        correlator = self.startAnalyticsBuilderCorrelator(
+            blockSourceDir=f'{self.project.SOURCE}/blocks/')
+        modelId = self.createTestModel('apamax.analyticsbuilder.blocks.DiscreteStatistics', {'windowSize':3}, inputs={'value':'float'})
+        self.sendEventStrings(correlator,
+                              self.timestamp(.9),
+                              self.inputEvent('value', 10, id=modelId),
+                              self.timestamp(1.9),
+                              self.inputEvent('value', 20, id=modelId),
+                              self.timestamp(2.9),
+                              self.inputEvent('value', 30, id=modelId),
+                              self.timestamp(3.9),
+                              self.inputEvent('value', 40, id=modelId),  # window is full : first value is dropped
+                              self.timestamp(4.9),
+                              self.inputEvent('value', 5, id=modelId),
+                              self.timestamp(6),
+                              )
+
+    def validate(self):
+        self.assertGrep('output.evt', expr=self.outputExpr('sum', 60, time=3))
+        self.assertGrep('output.evt', expr=self.outputExpr('count', 3, time=3))
+        self.assertGrep('output.evt', expr=self.outputExpr('min', 10, time=3))
+        self.assertGrep('output.evt', expr=self.outputExpr('standardDeviation', 8.16496580927726, time=3))
+
+        self.assertGrep('output.evt', expr=self.outputExpr('sum', 90, time=4))
+        self.assertGrep('output.evt', expr=self.outputExpr('count', 3, time=4))
+        self.assertGrep('output.evt', expr=self.outputExpr('min', 20, time=4))
+        self.assertGrep('output.evt', expr=self.outputExpr('max', 40, time=4))
+        self.assertGrep('output.evt', expr=self.outputExpr('mean', 30, time=4))
+
+        self.assertGrep('output.evt', expr=self.outputExpr('sum', 75, time=5))
+        self.assertGrep('output.evt', expr=self.outputExpr('min', 5, time=5))
+        self.assertGrep('output.evt', expr=self.outputExpr('max', 40, time=5))
+        self.assertGrep('output.evt', expr=self.outputExpr('mean', 25, time=5))
+        self.assertGrep('output.evt', expr=self.outputExpr('standardDeviation', 14.719601443879744, time=5))
@@ -0,0 +1,39 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+
+class PySysTest(AnalyticsBuilderBaseTest):
+    def execute(self):
+        correlator = self.startAnalyticsBuilderCorrelator(
+            blockSourceDir=f'{self.project.SOURCE}/blocks/')
+        self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.DiscreteStatistics', {'deadband':5.0}, inputs={'value':'float'})
+        self.sendEventStrings(correlator,
+                              self.timestamp(.9),
+                              self.inputEvent('value', 10, id=self.modelId),
+                              self.timestamp(1.9),
+                              self.inputEvent('value', 12, id=self.modelId),  # only the sum changes by more than 5
+                              self.timestamp(2.9),
+                              self.inputEvent('value', 30, id=self.modelId),
+                              self.timestamp(4),
+                              )
+
+    def validate(self):
+        # Every statistic is output for the first sample.
+        for output, value in [('sum', 10), ('count', 1), ('mean', 10), ('standardDeviation', 0), ('min', 10), ('max', 10)]:
+            self.assertGrep('output.evt', expr=self.outputExpr(output, value, time=1))
+
+        self.assertGrep('output.evt', expr=self.outputExpr('sum', 22, time=2))
+
+        self.assertGrep('output.evt', expr=self.outputExpr('sum', 52, time=3))
+        self.assertGrep('output.evt', expr=self.outputExpr('mean', 17.333333333333332, time=3))
+        self.assertGrep('output.evt', expr=self.outputExpr('standardDeviation', 8.993825042154695, time=3))
+        self.assertGrep('output.evt', expr=self.outputExpr('max', 30, time=3))
+
+        # Each statistic is compared with its own last output.
+        for output, count in [('sum', 3), ('count', 1), ('mean', 2), ('standardDeviation', 2), ('min', 1), ('max', 2)]:
+            self.assertLineCount('output.evt', expr='"' + output + '","' + self.modelId + '"', condition='==' + str(count))
@@ -0,0 +1,43 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+
+class PySysTest(AnalyticsBuilderBaseTest):
+    def execute(self):
+        correlator = self.startAnalyticsBuilderCorrelator(
+            blockSourceDir=f'{self.project.SOURCE}/blocks/')
+        self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.DiscreteStatistics', {'outputPerSample':True}, inputs={'value':'any'})
+        self.sendEventStrings(correlator,
+                              self.timestamp(.9),
+                              self.inputEvent('value', [10, 20, 30], id=self.modelId),
+                              self.timestamp(1.9),
+                              self.inputEvent('value', [], id=self.modelId),  # an empty burst is ignored
+                              self.timestamp(2.9),
+                              self.inputEvent('value', 'not a number', id=self.modelId),  # as is a value which is not a number
+                              self.timestamp(3.9),
+                              self.inputEvent('value', 40, id=self.modelId),
+                              self.timestamp(5),
+                              )
+
+    def validate(self):
+        # The statistics are generated once for the burst.
+        self.assertGrep('output.evt', expr=self.outputExpr('sum', 60, time=1))
+        self.assertGrep('output.evt', expr=self.outputExpr('count', 3, time=1))
+        self.assertGrep('output.evt', expr=self.outputExpr('mean', 20, time=1))
+        self.assertGrep('output.evt', expr=self.outputExpr('standardDeviation', 8.16496580927726, time=1))
+
+        # And the statistics after each sample of the burst.
+        self.assertGrep('output.evt', expr=r'"samplesOutput",.*"max":any[(]sequence<float>,[[]10,20,30[]][)]')
+        self.assertGrep('output.evt', expr=r'"samplesOutput",.*"mean":any[(]sequence<float>,[[]10,15,20[]][)]')
+        self.assertGrep('output.evt', expr=r'"samplesOutput",.*"min":any[(]sequence<float>,[[]10,10,10[]][)]')
+        self.assertGrep('output.evt', expr=r'"samplesOutput",.*"standardDeviation":any[(]sequence<float>,[[]0,5,8.16496580927726[]][)]')
+        self.assertLineCount('output.evt', expr='"samplesOutput","' + self.modelId + '"', condition='==1')
+
+        self.assertGrep('output.evt', expr=self.outputExpr('sum', 100, time=4))
+        self.assertGrep('output.evt', expr=self.outputExpr('count', 4, time=4))
+        self.assertLineCount('output.evt', expr='"sum","' + self.modelId + '"', condition='==2')
@@ -0,0 +1,43 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model which also outputs the positions of the edges in a burst.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.EdgeDetection',{'threshold':1.0, 'outputPerSample':True})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', [1.5, 2.9, 1.9, 2.3], id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('value', [1.1, 8.0, 9.5], id = self.modelId),
+		                      self.timestamp(3),
+		                      self.inputEvent('value', [], id = self.modelId),
+		                      self.timestamp(4),
+		                      self.inputEvent('value', 'not a number', id = self.modelId),
+		                      self.timestamp(5)
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		OUTPUT_REGEX = r'apamax.analyticsbuilder.test.Output[(]"%(outputId)s","%(modelId)s","[^"]*",%(time)s,any[(][^"]*,(.*)[)],[{].*[}][)]'
+		# The first sample of the first burst initializes the averages, and there is no edge in the rest of it.
+		self.assertThat("expected == output", expected='false', output__eval="self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'outputId':'isEdge', 'modelId':self.modelId,'time':1.1}).group(1)")
+		self.assertGrep('output.evt', expr=r'"edgesOutput","' + self.modelId + r'","[^"]*",1.1,.*"indices":any[(]sequence<integer>,[[][]][)]')
+		# The edge is at 8.0, the second sample of the second burst.
+		self.assertThat("expected == output", expected='true', output__eval="self.assertGrep('output.evt', expr=OUTPUT_REGEX%{'outputId':'isEdge', 'modelId':self.modelId,'time':2.1}).group(1)")
+		self.assertGrep('output.evt', expr=r'"edgesOutput","' + self.modelId + r'","[^"]*",2.1,.*"indices":any[(]sequence<integer>,[[]1[]][)]')
+		# The empty burst and the value which is not a number generate no output.
+		self.assertLineCount('output.evt', expr='"isEdge","' + self.modelId + '"', condition='==2')
+		self.assertLineCount('output.evt', expr='"edgesOutput","' + self.modelId + '"', condition='==2')
@@ -0,0 +1,25 @@
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+ 
+ 
+class PySysTest(AnalyticsBuilderBaseTest):
+    def execute(self):
+        correlator = self.startAnalyticsBuilderCorrelator(
+            blockSourceDir=f'{self.project.SOURCE}/blocks')
+        self.createTestModel('apamax.analyticsbuilder.BaseNConverter', {'base': 16, 'extractBits': '1,2,5-8'})
+        self.sendEventStrings(correlator,
+                              self.timestamp(1),
+                              self.inputEvent('input', "13"),
+                              self.timestamp(2),
+                              self.inputEvent('input', "f2"),
+                              self.timestamp(5),
+                              )
+ 
+    def validate(self):
+        self.assertGrep('output.evt', expr=self.outputExpr('numericConversion', 19))
+        self.assertGrep('output.evt', expr=self.outputExpr('numericConversion', 242))
+        # all the fields are output for each input
+        self.assertGrep('output.evt', expr='"bit1":any\(boolean,true\),"bit2":any\(boolean,true\),"bits5-8":any\(float,1\)')
+        self.assertGrep('output.evt', expr='"bit1":any\(boolean,false\),"bit2":any\(boolean,true\),"bits5-8":any\(float,15\)')
+        # only bit 1 and bits 5-8 changed on the second input
+        self.assertGrep('output.evt', expr='"bit1":any\(boolean,false\),"bits5-8":any\(float,15\)')
@@ -0,0 +1,39 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model with correct parameter.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.IntToFloat32')
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 0xC1200000, id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('value', 0x00000001, id = self.modelId),
+		                      self.timestamp(3),
+		                      # two floats, each in two 16 bit registers
+		                      self.inputEvent('value', [0x4120, 0x0000, 0x40A0, 0x0000], id = self.modelId),
+		                      self.timestamp(4)
+							  )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# sign bit
+		self.assertGrep('output.evt', expr=self.outputExpr('floatOutput',-10.0))
+		# smallest subnormal
+		self.assertGrep('output.evt', expr=self.outputExpr('floatOutput',1.401298464324817e-45))
+		# the last float of the registers
+		self.assertGrep('output.evt', expr=self.outputExpr('floatOutput',5.0))
+		
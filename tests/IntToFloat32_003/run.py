@@ -0,0 +1,48 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def floats(self, modelId):
+		"""
+		The values of the last Floats output of a model.
+		"""
+		values = self.getExprFromFile('output.evt', '"floatsOutput","' + modelId + '",.*"values":any[(]sequence<float>,[[]([^]]*)[]][)]', returnAll=True)[-1]
+		return [float(v) for v in values.split(',')]
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a model for each word and byte order, each converting 10.0 and 5.0 from two 16 bit registers each.
+		self.registers = {
+			('bigEndian', 'bigEndian'): [0x4120, 0x0000, 0x40A0, 0x0000],
+			('littleEndian', 'bigEndian'): [0x0000, 0x4120, 0x0000, 0x40A0],
+			('bigEndian', 'littleEndian'): [0x2041, 0x0000, 0xA040, 0x0000],
+			('littleEndian', 'littleEndian'): [0x0000, 0x2041, 0x0000, 0xA040],
+		}
+		self.modelIds = {}
+		for (wordOrder, byteOrder) in self.registers:
+			self.modelIds[(wordOrder, byteOrder)] = self.createTestModel('apamax.analyticsbuilder.custom.IntToFloat32', {'wordOrder':wordOrder, 'byteOrder':byteOrder})
+		
+		events = [self.timestamp(1)]
+		for orders, modelId in self.modelIds.items():
+			# a register left over after the last float is ignored
+			events.append(self.inputEvent('value', self.registers[orders] + [0x1234], id = modelId))
+		events.append(self.timestamp(2))
+		self.sendEventStrings(correlator, *events)
+
+	def validate(self):
+		for orders, modelId in self.modelIds.items():
+			# Verifying that the model is deployed successfully.
+			self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + modelId + '\" with PRODUCTION mode has started')
+			self.assertThat('floats == expected', floats=self.floats(modelId), expected=[10.0, 5.0])
+			# the Float output is the last float of the registers
+			self.assertGrep('output.evt', expr=self.outputExpr('floatOutput', 5.0, modelId))
+			self.assertLineCount('output.evt', expr='"floatsOutput","' + modelId + '"', condition='==1')
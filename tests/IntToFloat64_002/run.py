@@ -0,0 +1,60 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def floats(self, modelId):
+		"""
+		The values of each Floats output of a model.
+		"""
+		values = self.getExprFromFile('output.evt', '"floatsOutput","' + modelId + '",.*"values":any[(]sequence<float>,[[]([^]]*)[]][)]', returnAll=True)
+		return [[float(v) for v in output.split(',')] for output in values]
+
+	def floatOutputs(self, modelId):
+		"""
+		The values of all the Float outputs of a model.
+		"""
+		return [float(v) for v in self.getExprFromFile('output.evt', '"floatOutput","' + modelId + '","",[^,]*,any[(]float,(.*)[)],', returnAll=True)]
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		self.defaultId = self.createTestModel('apamax.analyticsbuilder.custom.IntToFloat64')
+		self.littleEndianId = self.createTestModel('apamax.analyticsbuilder.custom.IntToFloat64', {'wordOrder':'littleEndian', 'byteOrder':'littleEndian'})
+		self.wordsId = self.createTestModel('apamax.analyticsbuilder.custom.IntToFloat64', {'wordOrder':'littleEndian'})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      # a batch of 10.0, 5.0 and -10.0, in four 16 bit registers each
+		                      self.inputEvent('value', [0x4024, 0, 0, 0, 0x4014, 0, 0, 0, 0xC024, 0, 0, 0], id = self.defaultId),
+		                      self.inputEvent('value', [0, 0, 0, 0x2440, 0, 0, 0, 0x1440, 0, 0, 0, 0x24C0], id = self.littleEndianId),
+		                      self.inputEvent('value', [0, 0, 0, 0x4024, 0, 0, 0, 0x4014], id = self.wordsId),
+		                      self.timestamp(2),
+		                      # the smallest and largest subnormals
+		                      self.inputEvent('value', 0x0000000000000001, id = self.defaultId),
+		                      self.timestamp(3),
+		                      self.inputEvent('value', 0x000FFFFFFFFFFFFF, id = self.defaultId),
+		                      self.timestamp(4),
+		                      # and the largest subnormal in registers
+		                      self.inputEvent('value', [0xFFFF, 0xFFFF, 0xFFFF, 0x000F], id = self.wordsId),
+		                      self.timestamp(5)
+		                      )
+
+	def validate(self):
+		for modelId in [self.defaultId, self.littleEndianId, self.wordsId]:
+			# Verifying that the model is deployed successfully.
+			self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + modelId + '\" with PRODUCTION mode has started')
+		self.assertThat('floats == expected', floats=self.floats(self.littleEndianId), expected=[[10.0, 5.0, -10.0]])
+		self.assertThat('floatOutputs == expected', floatOutputs=self.floatOutputs(self.littleEndianId), expected=[-10.0])
+		self.assertThat('floats == expected', floats=self.floats(self.defaultId), expected=[[10.0, 5.0, -10.0]])
+		# the Float output is the last float of the batch, then each subnormal
+		self.assertThat('floatOutputs == expected', floatOutputs=self.floatOutputs(self.defaultId), expected=[-10.0, 5e-324, 2.225073858507201e-308])
+		# with only the word order reversed, the first register of each float is the least significant word
+		self.assertThat('floats == expected', floats=self.floats(self.wordsId), expected=[[10.0, 5.0], [2.225073858507201e-308]])
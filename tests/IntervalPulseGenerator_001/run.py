@@ -0,0 +1,48 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/simulation-blocks/')
+
+		# The mock inventory treats ids starting with "group" as a group of the devices "1" and "2".
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/CreateMultiMeasurement_001/Input/SendC8yObjects.mon')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model for the group, pulsing every 10 seconds spread over the whole interval.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.simulation.IntervalPulseGenerator', {'deviceId':'group1', 'interval':10.0, 'phaseSpread':1.0})
+		# and one with the default phase spread, pulsing both devices together.
+		self.lockStepId = self.createTestModel('apamax.analyticsbuilder.blocks.simulation.IntervalPulseGenerator', {'deviceId':'group1', 'interval':10.0})
+
+		# the two devices pulse half an interval apart, from one interval after the start
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.timestamp(12),
+		                      self.timestamp(17),
+		                      self.timestamp(22)
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.lockStepId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('tick', True, self.modelId, time=10))
+		self.assertGrep('output.evt', expr=self.outputExpr('tick', True, self.modelId, time=15))
+		self.assertGrep('output.evt', expr=self.outputExpr('tick', True, self.modelId, time=20))
+		# in lock-step both devices would have pulsed at 10 and 20 seconds
+		self.assertLineCount('output.evt', expr=self.outputExpr('tick', True, self.modelId), condition='==3')
+		# which is what the default does
+		self.assertLineCount('output.evt', expr=self.outputExpr('tick', True, self.lockStepId, time=10), condition='==2')
+		self.assertLineCount('output.evt', expr=self.outputExpr('tick', True, self.lockStepId, time=20), condition='==2')
+		self.assertLineCount('output.evt', expr=self.outputExpr('tick', True, self.lockStepId), condition='==4')
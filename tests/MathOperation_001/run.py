@@ -0,0 +1,36 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a model with an expression and one using the maximum of its inputs.
+		self.expressionId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'expression', 'expression':'(value1 - value2) * 0.5 + -value3^2'})
+		self.maximumId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'maximum'})
+		
+		events = [self.timestamp(1)]
+		for modelId in [self.expressionId, self.maximumId]:
+			events += [
+				self.inputEvent('value1', 7.0, id = modelId),
+				self.inputEvent('value2', 1.0, id = modelId),
+				self.inputEvent('value3', 3.0, id = modelId),
+			]
+		events.append(self.timestamp(2))
+		self.sendEventStrings(correlator, *events)
+
+	def validate(self):
+		# Verifying that the models are deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.expressionId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.maximumId + '\" with PRODUCTION mode has started')
+		# (7 - 1) * 0.5 - 3^2
+		self.assertGrep('output.evt', expr=self.outputExpr('output', -6, time=1))
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 7, time=1))
@@ -0,0 +1,53 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a model with well formed numbers, and models which should be rejected.
+		self.numbersId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'expression', 'expression':'2.5e1 + .5 * value1 - 1E-1'})
+		self.pointsId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'expression', 'expression':'2.5.3 * value1'})
+		self.exponentId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'expression', 'expression':'value1 * 1e'})
+		self.unknownId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'power'})
+		# An expression only needs the inputs it uses, and an operation needs the first two.
+		self.laterInputsId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'expression', 'expression':'value3 * 2 + value4'})
+		self.addId = self.createTestModel('apamax.analyticsbuilder.blocks.MathOperation', {'operation':'add'})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value1', 4.0, id = self.numbersId),
+		                      self.inputEvent('value3', 5.0, id = self.laterInputsId),
+		                      self.inputEvent('value4', 1.0, id = self.laterInputsId),
+		                      self.inputEvent('value1', 2.0, id = self.addId),
+		                      self.inputEvent('value3', 3.0, id = self.addId),
+		                      self.timestamp(2),
+		                      self.inputEvent('value2', 1.0, id = self.addId),
+		                      self.timestamp(3))
+
+	def validate(self):
+		logfile = self.analyticsBuilderCorrelator.logfile
+		self.assertGrep(logfile, expr='Model \"' + self.numbersId + '\" with PRODUCTION mode has started')
+		# 25 + 0.5 * 4 - 0.1
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 26.9, self.numbersId, time=1))
+		self.assertLineCount('output.evt', expr='Output\("output","' + self.numbersId + '"', condition='==1')
+		# 5 * 2 + 1, once value4 has a value, without value1 or value2
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 11, self.laterInputsId, time=1))
+		self.assertLineCount('output.evt', expr='Output\("output","' + self.laterInputsId + '"', condition='==1')
+		# 2 + 1 + 3, only once value2 has a value
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 6, self.addId, time=2))
+		self.assertLineCount('output.evt', expr='Output\("output","' + self.addId + '"', condition='==1')
+		# The malformed numbers and the unknown operation are rejected when the models are validated.
+		for modelId in [self.pointsId, self.exponentId, self.unknownId]:
+			self.assertGrep(logfile, expr='Model \"' + modelId + '\" with PRODUCTION mode has started', contains=False)
+		self.assertGrep(logfile, expr="Invalid number '2.5.3' in expression")
+		self.assertGrep(logfile, expr="Invalid number '1e' in expression")
+		self.assertGrep(logfile, expr="Unknown operation 'power'")
@@ -0,0 +1,26 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		correlator.injectEPL(self.input + '/PopulatePlans.mon')
+
+	def validate(self):
+		logfile = self.analyticsBuilderCorrelator.logfile
+		self.assertGrep(logfile, expr='Populated apamax.analyticsbuilder.test.Series\("dev0",\[apamax.analyticsbuilder.test.Reading\("a",1.5,optional\(2\)\),apamax.analyticsbuilder.test.Reading\("b",2.5,optional\(\)\)\]\)')
+		self.assertGrep(logfile, expr='Populated apamax.analyticsbuilder.test.Series\("dev2",')
+		# The plans are worked out by the first conversion and then reused, so the cache does not grow.
+		plans = '\["apamax.analyticsbuilder.test.Reading","apamax.analyticsbuilder.test.Series","optional<integer>","sequence<apamax.analyticsbuilder.test.Reading>"\]'
+		self.assertLineCount(logfile, expr='Populated .* plans=' + plans, condition='==3')
+		# Each conversion uses a plan for the Series, its sequence, and each Reading and quality.
+		self.assertGrep(logfile, expr='Populated .*"dev0".* uses=5$')
+		self.assertGrep(logfile, expr='Populated .*"dev2".* uses=15$')
+		# The Reading and Label plans were used least recently, so they were evicted to make room for the Series plans.
+		self.assertGrep(logfile, expr='Limited plans=\["apamax.analyticsbuilder.test.Series","sequence<apamax.analyticsbuilder.test.Reading>"\]')
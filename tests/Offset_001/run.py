@@ -0,0 +1,41 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model which only outputs changes of more than 1, or after 10 seconds without output.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.Offset', {'offset':10.0, 'deadband':1.0, 'maxSilence':10.0})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 1.0, id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('value', 1.5, id = self.modelId),
+		                      self.timestamp(3),
+		                      self.inputEvent('value', 2.5, id = self.modelId),
+		                      self.timestamp(4),
+		                      self.inputEvent('value', 2.6, id = self.modelId),
+		                      self.timestamp(5),
+		                      self.inputEvent('value', 2.5, id = self.modelId),
+		                      self.timestamp(20),
+		                      self.inputEvent('value', 2.6, id = self.modelId),
+		                      self.timestamp(21),
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 11))
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 12.5))
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 12.6))
+		self.assertLineCount('output.evt', expr='"output","' + self.modelId + '"', condition='==3')
@@ -0,0 +1,43 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model which only outputs changes of more than 10% of the last output, at most once every 5 seconds.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.Offset', {'offset':0.0, 'deadband':10.0, 'deadbandPercent':True, 'minInterval':5.0})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 100.0, id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('value', 120.0, id = self.modelId),
+		                      self.timestamp(6),
+		                      self.inputEvent('value', 105.0, id = self.modelId),
+		                      self.timestamp(7),
+		                      self.inputEvent('value', 112.0, id = self.modelId),
+		                      self.timestamp(8),
+		                      self.inputEvent('value', 200.0, id = self.modelId),
+		                      self.timestamp(12),
+		                      self.inputEvent('value', 200.0, id = self.modelId),
+		                      self.timestamp(13),
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 100, time=1))
+		# 120 is within 5 seconds of the last output, and 105 is within 10% of it.
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 112, time=7))
+		# 200 is only output once 5 seconds have passed since 112 was output.
+		self.assertGrep('output.evt', expr=self.outputExpr('output', 200, time=12))
+		self.assertLineCount('output.evt', expr='"output","' + self.modelId + '"', condition='==3')
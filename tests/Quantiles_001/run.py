@@ -0,0 +1,31 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	ACCURACY = 0.01
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.Quantiles', {'quantiles':'0.5, 0.95, 0.99', 'relativeAccuracy':self.ACCURACY}, inputs={'value':'float'})
+		# the values 1 to 1000, in a shuffled order
+		events = []
+		for i in range(1000):
+			events.append(self.timestamp(i + 1))
+			events.append(self.inputEvent('value', (i * 7919) % 1000 + 1, id=self.modelId))
+		events.append(self.timestamp(1002))
+		self.sendEventStrings(correlator, *events)
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('count', 1000, self.modelId))
+		median = float(self.getExprFromFile('output.evt', '"median","' + self.modelId + '","",[^,]*,any[(]float,(.*)[)],', returnAll=True)[-1])
+		self.assertThat('abs(median - 500) <= accuracy * 500', median=median, accuracy=self.ACCURACY)
+		quantiles = self.getExprFromFile('output.evt', '"quantiles","' + self.modelId + '",.*"0.95":any[(]float,([^)]*)[)].*"0.99":any[(]float,([^)]*)[)]', returnAll=True)[-1]
+		self.assertThat('abs(p95 - 950) <= accuracy * 950', p95=float(quantiles[0]), accuracy=self.ACCURACY)
+		self.assertThat('abs(p99 - 990) <= accuracy * 990', p99=float(quantiles[1]), accuracy=self.ACCURACY)
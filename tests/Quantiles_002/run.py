@@ -0,0 +1,61 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+import math
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	ACCURACY = 0.01
+
+	GAMMA = (1 + ACCURACY) / (1 - ACCURACY)
+
+	def bin(self, value):
+		"""
+		The index of the bin of a positive value in the sketch.
+		"""
+		return math.ceil(math.log(value) / math.log(self.GAMMA))
+
+	def binValue(self, bin):
+		"""
+		The value representing a bin of positive values in the sketch.
+		"""
+		return 2 * self.GAMMA ** bin / (self.GAMMA + 1)
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		# Only 2 bins are kept, so values further apart than that are merged into the lowest bin.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.Quantiles', {'relativeAccuracy':self.ACCURACY, 'maxBins':2}, inputs={'value':'float', 'sample':'pulse', 'reset':'pulse'})
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 1, id=self.modelId),
+		                      self.inputEvent('sample', 'true', id=self.modelId, eplType = 'boolean'),
+		                      self.timestamp(2),
+		                      self.inputEvent('value', 10, id=self.modelId),
+		                      self.inputEvent('sample', 'true', id=self.modelId, eplType = 'boolean'),
+		                      self.timestamp(3),
+		                      self.inputEvent('value', 100, id=self.modelId),
+		                      self.inputEvent('sample', 'true', id=self.modelId, eplType = 'boolean'),
+		                      self.timestamp(4),
+		                      self.inputEvent('value', 5, id=self.modelId),
+		                      self.inputEvent('sample', 'true', id=self.modelId, eplType = 'boolean'),
+		                      self.inputEvent('reset', 'true', id=self.modelId, eplType = 'boolean'),  # reset and sample at same time : only the new value is counted
+		                      self.timestamp(5),
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		medians = [float(m) for m in self.getExprFromFile('output.evt', '"median","' + self.modelId + '","",[^,]*,any[(]float,(.*)[)],', returnAll=True)]
+		self.assertThat('len(medians) == 4', medians=medians)
+		self.assertThat('abs(median - expected) <= 1e-9 * expected', median=medians[0], expected=self.binValue(self.bin(1)))
+		# When 10 is added, 1 is merged into the bin below the bin of 10, so the median loses its accuracy.
+		self.assertThat('abs(median - expected) <= 1e-9 * expected', median=medians[1], expected=self.binValue(self.bin(10) - 1))
+		# And when 100 is added, 1 and 10 are merged into the bin below the bin of 100.
+		self.assertThat('abs(median - expected) <= 1e-9 * expected', median=medians[2], expected=self.binValue(self.bin(100) - 1))
+		self.assertGrep('output.evt', expr=self.outputExpr('count', 3, self.modelId, time=3))
+		# After the reset, only the new value is counted.
+		self.assertThat('abs(median - expected) <= accuracy * expected', median=medians[3], expected=5, accuracy=self.ACCURACY)
+		self.assertGrep('output.evt', expr=self.outputExpr('count', 1, self.modelId, time=4))
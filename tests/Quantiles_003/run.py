@@ -0,0 +1,27 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	ACCURACY = 0.01
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		correlator.injectEPL(self.input + '/MergeSketches.mon')
+
+	def validate(self):
+		logfile = self.analyticsBuilderCorrelator.logfile
+		self.assertGrep(logfile, expr='Count merged=1001 all=1001')
+		# The merged sketch has the same bins as the sketch of all the values, so the quantiles are the same.
+		quantiles = self.getExprFromFile(logfile, 'Quantile ([^ ]*) merged=([^ ]*) all=(.*)', returnAll=True)
+		self.assertThat('len(quantiles) == 7', quantiles=quantiles)
+		for q, merged, expected in quantiles:
+			self.assertThat('merged == expected', merged=float(merged), expected=float(expected))
+		# And within the relative accuracy of the exact quantiles of -500 to 500.
+		for q, merged, expected in quantiles:
+			exact = -500 + float(q) * 1000
+			self.assertThat('abs(merged - exact) <= accuracy * abs(exact)', merged=float(merged), exact=exact, accuracy=self.ACCURACY)
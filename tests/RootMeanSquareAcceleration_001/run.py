@@ -23,7 +23,9 @@ class PySysTest(AnalyticsBuilderBaseTest):
 	def validate(self):
 		# Verifying that the model is deployed successfully.
 		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
-		self.assertGrep('output.evt', expr=self.outputExpr('Grms',3.2443445876655126,self.modelId,'.*',1,{}))
+		self.assertGrep('output.evt', expr=self.outputExpr('Grms',3.2443445876655126,self.modelId))
+		# The Grms is only output once, when the model starts.
+		self.assertLineCount('output.evt', expr='"Grms","' + self.modelId + '"', condition='==1')
 		
 			
 		
\ No newline at end of file
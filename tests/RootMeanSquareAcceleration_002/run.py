@@ -0,0 +1,30 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# A single segment profile, the same curve as the frequency and ASD parameters of RootMeanSquareAcceleration_001.
+		self.modelId_single = self.createTestModel('apamax.analyticsbuilder.custom.RootMeanSquareAcceleration', {'profile':'20:1.0,30:1.1'})
+		# A profile with a flat segment added.
+		self.modelId_multi = self.createTestModel('apamax.analyticsbuilder.custom.RootMeanSquareAcceleration', {'profile':'20:1.0, 30:1.1, 40:1.1'})
+
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.timestamp(2)
+		                      )
+
+	def validate(self):
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId_single + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId_multi + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('Grms', 3.2443445876655126, self.modelId_single))
+		self.assertGrep('output.evt', expr=self.outputExpr('Grms', 4.639587460487679, self.modelId_multi))
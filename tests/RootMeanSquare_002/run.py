@@ -0,0 +1,46 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model with a small window so the buffer wraps around several times.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.RootMeanSquare', {'setSize':2})
+
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 1.0, id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('value', 2.5, id = self.modelId),
+		                      self.timestamp(3),
+		                      self.inputEvent('value', -3.0, id = self.modelId),
+		                      self.timestamp(4),
+		                      self.inputEvent('value', 4, id = self.modelId),
+		                      self.timestamp(5),
+		                      self.inputEvent('value', 0.1, id = self.modelId),
+		                      self.timestamp(6),
+		                      self.inputEvent('value', 7.25, id = self.modelId),
+		                      self.timestamp(7),
+		                      self.inputEvent('value', -2.0, id = self.modelId),
+		                      self.timestamp(8),
+		                      )
+
+	def validate(self):
+
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',1))
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',1.9039432764659772))
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',2.7613402542968153))
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',3.5355339059327378))
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',2.8293108701590217))
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',5.127011800259484))
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',5.318011846545662))
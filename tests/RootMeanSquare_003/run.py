@@ -0,0 +1,37 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model which also outputs the root mean square after each sample of a burst.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.RootMeanSquare', {'setSize':4, 'outputPerSample':True})
+
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 2.0, id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('value', [3.0, 4.0, 0.0], id = self.modelId),
+		                      self.timestamp(3),
+		                      self.inputEvent('value', 1.0, id = self.modelId),
+		                      self.timestamp(4),
+		                      )
+
+	def validate(self):
+
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',2))
+		# one output for the whole burst
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',2.692582403567252))
+		self.assertGrep('output.evt', expr=self.outputExpr('rootMeanSquareOutput',2.5495097567963922))
+		self.assertLineCount('output.evt', expr='"rootMeanSquareOutput","' + self.modelId + '"', condition='==3')
+		self.assertGrep('output.evt', expr=r'"samplesOutput",.*[[]2.5495097567963922,3.1091263510296048,2.692582403567252[]]')
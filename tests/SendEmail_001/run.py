@@ -0,0 +1,47 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		correlator.injectEPL(self.input + '/LogEmails.mon')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model which sends at most 2 emails every 10 seconds.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.SendEmail',
+									  {'receivers':'a@example.com', 'replyTo':'b@example.com', 'subject':'Alert', 'text':'Threshold crossed', 'maxEmails':2, 'ratePeriod':10.0})
+
+		# A burst of 4 sends: the first 2 are sent, and the others are over the limit.
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(2),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(3),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(4),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      # By now, more than one email's worth of the limit has been refilled.
+		                      self.timestamp(10),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(11),
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='Received SendEmail: ', condition='==3')
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='Received SendEmail: .*"Threshold crossed"', condition='==2')
+		# The email after the burst says how many were not sent.
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='Received SendEmail: .*"Threshold crossed\\\\n\\\\n2 earlier emails were not sent because of the rate limit."', condition='==1')
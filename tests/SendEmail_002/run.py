@@ -0,0 +1,48 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+
+	def preInjectBlock(self, corr):
+		corr.injectEPL([self.project.APAMA_HOME +'/monitors/'+i+'.mon' for i in ['TimeFormatEvents']])
+
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		correlator.injectEPL(f'{self.project.SOURCE}/tests/SendEmail_001/Input/LogEmails.mon')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model which collects the sends over 10 seconds into one email, and sends at most 1 email every 60 seconds.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.SendEmail',
+									  {'receivers':'a@example.com', 'replyTo':'b@example.com', 'subject':'Alert', 'text':'Threshold crossed', 'digestWindow':10.0, 'maxEmails':1, 'ratePeriod':60.0})
+
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(3),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(7),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(12),
+		                      # The digests of this window and the next are over the rate limit.
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(25),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      # And are counted in the digest of this window.
+		                      self.timestamp(70),
+		                      self.inputEvent('send', True, id = self.modelId),
+		                      self.timestamp(81),
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertLineCount(self.analyticsBuilderCorrelator.logfile, expr='Received SendEmail: ', condition='==2')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Received SendEmail: .*"Threshold crossed\\\\n\\\\nTriggered 3 times between 1970-01-01T00:00:01Z and 1970-01-01T00:00:07Z."')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Received SendEmail: .*"Threshold crossed\\\\n\\\\nTriggered 1 time between 1970-01-01T00:01:10Z and 1970-01-01T00:01:10Z.\\\\n\\\\n2 earlier emails were not sent because of the rate limit."')
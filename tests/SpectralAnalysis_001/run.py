@@ -0,0 +1,42 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+import math
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying the two modes, over windows of one second.
+		self.fftId = self.createTestModel('apamax.analyticsbuilder.custom.SpectralAnalysis', {'mode':'fft', 'sampleRate':64.0, 'windowSize':64})
+		self.goertzelId = self.createTestModel('apamax.analyticsbuilder.custom.SpectralAnalysis', {'mode':'goertzel', 'sampleRate':64.0, 'windowSize':64, 'frequencies':'4,8'})
+		
+		# one second of an 8 Hz sine wave with an amplitude of 2, in a single burst
+		burst = [2.0 * math.sin(2.0 * math.pi * 8.0 * i / 64.0) for i in range(64)]
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', burst, id = self.fftId),
+		                      self.inputEvent('value', burst, id = self.goertzelId),
+		                      self.timestamp(2)
+							  )
+
+	def output(self, outputId, modelId, expr='any[(]float,([^)]*)[)]'):
+		return self.getExprFromFile('output.evt', '"' + outputId + '","' + modelId + '",.*' + expr)
+
+	def validate(self):
+		# Verifying that the models are deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.fftId + '\" with PRODUCTION mode has started')
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.goertzelId + '\" with PRODUCTION mode has started')
+		# the root mean square of a sine wave is its amplitude divided by sqrt(2)
+		self.assertThat('abs(grms - expected) < 1e-9', grms=float(self.output('Grms', self.fftId)), expected=math.sqrt(2.0))
+		self.assertThat('abs(grms - expected) < 1e-9', grms=float(self.output('Grms', self.goertzelId)), expected=math.sqrt(2.0))
+		self.assertThat('peak == 8.0', peak=float(self.output('spectrum', self.fftId, '"peakFrequency":any[(]float,([^)]*)[)]')))
+		self.assertThat('abs(amplitude - 2.0) < 1e-9', amplitude=float(self.output('spectrum', self.goertzelId, '"8":any[(]float,([^)]*)[)]')))
+		self.assertThat('abs(amplitude) < 1e-9', amplitude=float(self.output('spectrum', self.goertzelId, '"4":any[(]float,([^)]*)[)]')))
@@ -0,0 +1,36 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+import math
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying the FFT mode with a band above the offset.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.SpectralAnalysis', {'mode':'fft', 'sampleRate':64.0, 'windowSize':64, 'bandLow':2.0})
+
+		# one second of an 8 Hz sine wave with an amplitude of 0.2 on an offset of 1, like gravity on an accelerometer
+		burst = [1.0 + 0.2 * math.sin(2.0 * math.pi * 8.0 * i / 64.0) for i in range(64)]
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', burst, id = self.modelId),
+		                      self.timestamp(2)
+		                      )
+
+	def output(self, outputId, expr='any[(]float,([^)]*)[)]'):
+		return self.getExprFromFile('output.evt', '"' + outputId + '","' + self.modelId + '",.*' + expr)
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# the offset has a much higher density at 0 Hz and 1 Hz, but is not the peak and is not in the band
+		self.assertThat('peak == 8.0', peak=float(self.output('spectrum', '"peakFrequency":any[(]float,([^)]*)[)]')))
+		self.assertThat('abs(grms - expected) < 1e-9', grms=float(self.output('Grms')), expected=0.2 / math.sqrt(2.0))
@@ -0,0 +1,48 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a model which only outputs changes of more than 100 seconds, at most once a minute.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.custom.TimeAtLevelCounting', {'threshold':50.0, 'deadband':100.0, 'minInterval':60.0})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(100),
+		                      self.inputEvent('value', 40.0, id = self.modelId),
+		                      self.timestamp(110),
+		                      self.inputEvent('value', 60.0, id = self.modelId),
+		                      self.timestamp(130),
+		                      self.inputEvent('value', 60.0, id = self.modelId),
+		                      self.timestamp(200),
+		                      self.inputEvent('value', 60.0, id = self.modelId),
+		                      self.timestamp(230),
+		                      self.inputEvent('value', 60.0, id = self.modelId),
+		                      self.timestamp(250),
+		                      self.inputEvent('value', 60.0, id = self.modelId),
+		                      self.timestamp(260),
+		                      self.inputEvent('value', 40.0, id = self.modelId),
+		                      self.timestamp(270),
+		                      self.inputEvent('value', 40.0, id = self.modelId),
+		                      self.timestamp(280),
+		                      )
+
+	def validate(self):
+
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertGrep('output.evt', expr=self.outputExpr('timeAtLevelOutput',0,self.modelId,"",100.1,{}))
+		# 20 and 90 seconds are filtered by the minimum interval and the deadband.
+		self.assertGrep('output.evt', expr=self.outputExpr('timeAtLevelOutput',120,self.modelId,"",230.1,{}))
+		# The total time of the breach and the reset are output although they are within a minute of the last output.
+		self.assertGrep('output.evt', expr=self.outputExpr('timeAtLevelOutput',150,self.modelId,"",260.1,{}))
+		self.assertGrep('output.evt', expr=self.outputExpr('timeAtLevelOutput',0,self.modelId,"",260.1,{}))
+		self.assertLineCount('output.evt', expr='"timeAtLevelOutput","' + self.modelId + '"', condition='==4')
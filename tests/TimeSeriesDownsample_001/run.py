@@ -0,0 +1,36 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model with buckets of 10 seconds.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.TimeSeriesDownsample', {'bucketWidth':10.0, 'aggregation':'mean'}, inputs={'sample': None})
+		
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 2.0, id = self.modelId),
+		                      self.timestamp(5),
+		                      self.inputEvent('value', 4.0, id = self.modelId),
+		                      self.timestamp(12),
+		                      self.inputEvent('value', 10.0, id = self.modelId),
+		                      self.timestamp(25)
+							  )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# each bucket is output when it ends, without a sample input
+		self.assertThat('outputs == expected', outputs = [(value['properties']['mean'], value['properties']['count'], value['properties']['sum']) for value in self.allOutputFromBlock()], expected = [
+			(3.0, 2, 6.0),
+			(10.0, 1, 10.0),
+			])
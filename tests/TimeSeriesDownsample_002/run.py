@@ -0,0 +1,49 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model selecting one point from each bucket of 10 seconds.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.TimeSeriesDownsample', {'bucketWidth':10.0, 'aggregation':'lttb'}, inputs={'sample': None})
+		
+		# There are no values in the bucket from 20 to 30, or after the bucket from 30 to 40.
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 2.0, id = self.modelId),
+		                      self.timestamp(5),
+		                      self.inputEvent('value', 4.0, id = self.modelId),
+		                      self.timestamp(12),
+		                      self.inputEvent('value', 10.0, id = self.modelId),
+		                      self.timestamp(15),
+		                      self.inputEvent('value', 1.0, id = self.modelId),
+		                      self.timestamp(31),
+		                      self.inputEvent('value', 7.0, id = self.modelId),
+		                      self.timestamp(55)
+		                      )
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		# each bucket is output one bucket width after it ends; the first point of the first bucket is selected,
+		# and the last point of a bucket which is not followed by values
+		outputs = self.allOutputFromBlock()
+		self.assertThat('outputs == expected', outputs = [(value['properties']['mean'], value['properties']['count'], value['properties']['sum']) for value in outputs], expected = [
+			(3.0, 2, 6.0),
+			(5.5, 2, 11.0),
+			(7.0, 1, 7.0),
+			])
+		self.assertThat('selected == expected', selected = [list(value['properties']['measurements'].values()) for value in outputs], expected = [
+			[2.0],
+			[1.0],
+			[7.0],
+			])
@@ -0,0 +1,65 @@
+#
+#  $Copyright (c) 2019 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json, threading
+
+class StubHandler(BaseHTTPRequestHandler):
+	"""Records the request bodies, failing the first request."""
+	def do_POST(self):
+		body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+		requests = self.server.requests
+		status = 503 if len(requests) == 0 else 200
+		requests.append({'status':status, 'values':[v['value'] for v in body['values']]})
+		self.send_response(status)
+		self.send_header('Content-Length', '0')
+		self.end_headers()
+
+	def log_message(self, format, *args):
+		pass
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		# Local HTTP server standing in for the receiver of the webhook.
+		port = self.getNextAvailableTCPPort()
+		self.server = HTTPServer(('localhost', port), StubHandler)
+		self.server.requests = []
+		threading.Thread(target=self.server.serve_forever, daemon=True).start()
+		self.addCleanupFunction(self.server.shutdown)
+
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+		
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+		
+		# Deploying a new model in batched delivery mode.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.HTTPWebhook',
+		                                    {'host':'localhost', 'port':port, 'path':'/hook', 'maxBatchSize':2, 'maxLinger':1.0, 'maxRetries':1})
+		
+		# The first batch fails and is retried after 1 second; the third value is sent once the linger time has elapsed.
+		self.sendEventStrings(correlator,
+		                      self.timestamp(1),
+		                      self.inputEvent('value', 1, id = self.modelId),
+		                      self.inputEvent('value', 2, id = self.modelId),
+		                      self.inputEvent('value', 3, id = self.modelId),
+		                      )
+		self.waitForGrep(self.analyticsBuilderCorrelator.logfile, expr='Unable to connect localhost. Error code: .*. Retrying in 1(\\.0)? seconds')
+		self.sendEventStrings(correlator, self.timestamp(2))
+		# The status is output once the responses to the retry and the last batch are handled.
+		self.waitForGrep('output.evt', expr='"delivered":any\\(integer,3\\)')
+		self.sendEventStrings(correlator, self.timestamp(3))
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertThat('requests[0] == expected', requests = self.server.requests, expected = {'status':503, 'values':[1, 2]})
+		self.assertThat('sorted(requests[1:], key=lambda r: r["values"]) == expected', requests = self.server.requests, expected = [
+			{'status':200, 'values':[1, 2]},
+			{'status':200, 'values':[3]},
+			])
+		self.assertThat('outputs[-1] == expected', outputs = [value['properties'] for value in self.allOutputFromBlock()],
+		                expected = {'delivered':3, 'failed':0, 'queued':0, 'dropped':0})
@@ -0,0 +1,63 @@
+#
+#  $Copyright (c) 2021 Software AG, Darmstadt, Germany and/or Software AG USA Inc., Reston, VA, USA, and/or its subsidiaries and/or its affiliates and/or their licensors.$
+#   This file is licensed under the Apache 2.0 license - see https://www.apache.org/licenses/LICENSE-2.0
+#
+
+from pysys.constants import *
+from apamax.analyticsbuilder.basetest import AnalyticsBuilderBaseTest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json, threading
+
+class StubHandler(BaseHTTPRequestHandler):
+	"""Records the request bodies, failing every request."""
+	def do_POST(self):
+		body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+		self.server.requests.append([v['value'] for v in body['values']])
+		self.send_response(503)
+		self.send_header('Content-Length', '0')
+		self.end_headers()
+
+	def log_message(self, format, *args):
+		pass
+
+class PySysTest(AnalyticsBuilderBaseTest):
+	def execute(self):
+		# Local HTTP server standing in for a receiver which is down.
+		port = self.getNextAvailableTCPPort()
+		self.server = HTTPServer(('localhost', port), StubHandler)
+		self.server.requests = []
+		threading.Thread(target=self.server.serve_forever, daemon=True).start()
+		self.addCleanupFunction(self.server.shutdown)
+
+		correlator = self.startAnalyticsBuilderCorrelator(blockSourceDir=f'{self.project.SOURCE}/blocks/')
+
+		# engine_receive process listening on all the channels.
+		correlator.receive('all.evt')
+
+		# Deploying a new model which sends each value on its own, with room for 3 values including the one being retried.
+		self.modelId = self.createTestModel('apamax.analyticsbuilder.blocks.HTTPWebhook',
+		                                    {'host':'localhost', 'port':port, 'path':'/hook', 'maxBatchSize':1, 'maxInFlight':1, 'maxQueueSize':3, 'maxRetries':5})
+
+		# Each failed value waits to be retried, so holds the only request in flight. Once the queue is full, each new value
+		# drops the value being retried and the next queued value is sent.
+		self.sendEventStrings(correlator, self.timestamp(1))
+		# The block logs each failed response once it has handled it, so wait for that before sending the next value.
+		expectedFailures = [1, 1, 1, 2, 3, 4, 5, 6, 7, 8]
+		for value in range(1, 11):
+			self.sendEventStrings(correlator, self.inputEvent('value', value, id = self.modelId))
+			self.waitForGrep(self.analyticsBuilderCorrelator.logfile, expr='Unable to connect localhost. Error code: ', condition=f'>={expectedFailures[value - 1]}')
+
+		# The value still waiting is retried after 1 second.
+		self.sendEventStrings(correlator, self.timestamp(2))
+		self.waitForGrep(self.analyticsBuilderCorrelator.logfile, expr='Unable to connect localhost. Error code: ', condition='>=9')
+		self.sendEventStrings(correlator, self.timestamp(2.5))
+		self.waitForGrep('output.evt', expr='"delivered":any\\(integer,0\\),"dropped":any\\(integer,7\\),"failed":any\\(integer,0\\),"queued":any\\(integer,3\\)')
+
+	def validate(self):
+		# Verifying that the model is deployed successfully.
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Model \"' + self.modelId + '\" with PRODUCTION mode has started')
+		self.assertThat('requests == expected', requests = self.server.requests, expected = [[1], [2], [3], [4], [5], [6], [7], [8], [8]])
+		self.assertGrep(self.analyticsBuilderCorrelator.logfile, expr='Unable to connect localhost. Error code: .*. Retrying in 1(\\.0)? seconds')
+		# Values 9 and 10 are queued and 8 is being retried; the rest were dropped.
+		self.assertThat('outputs[-1] == expected', outputs = [value['properties'] for value in self.allOutputFromBlock()],
+		                expected = {'delivered':0, 'failed':0, 'queued':3, 'dropped':7})